@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import json
 import sys
-from pathlib import Path
+from typing import Any, Literal
 
 import click
 
-from .core import ModelPackager, ModelUnpackager
-from .models import OCIConfig
+# core and models (and with them pydantic, tarfile and the executors) are
+# imported inside each command, so `--version` and `--help` stay cheap.
 
 
 @click.group()
@@ -45,6 +45,13 @@ def main() -> None:
     default="{}",
     help="Extra metadata as JSON string.",
 )
+@click.option(
+    "--compressor",
+    type=click.Choice(["gzip", "zstd", "none"]),
+    default="gzip",
+    show_default=True,
+    help="Layer blob compression (zstd requires the 'zstd' extra).",
+)
 def pack_command(
     model_dir: str,
     name: str,
@@ -52,6 +59,7 @@ def pack_command(
     framework: str,
     architecture: str,
     metadata_json: str,
+    compressor: Literal["gzip", "zstd", "none"],
 ) -> None:
     """Package a model directory into an OCI-compliant tar archive."""
     try:
@@ -60,25 +68,58 @@ def pack_command(
         click.echo(f"Error: invalid JSON for --metadata: {exc}", err=True)
         sys.exit(1)
 
+    try:
+        report = _do_pack(
+            model_dir,
+            name,
+            model_version,
+            framework=framework,
+            architecture=architecture,
+            metadata=metadata,
+            compressor=compressor,
+        )
+    except (NotADirectoryError, FileNotFoundError, ImportError) as exc:
+        click.echo(f"Error: {exc}", err=True)
+        sys.exit(1)
+
+    click.echo(report)
+
+
+def _do_pack(
+    model_dir: str,
+    name: str,
+    model_version: str,
+    *,
+    framework: str = "pytorch",
+    architecture: str = "transformer",
+    metadata: dict[str, Any] | None = None,
+    compressor: Literal["gzip", "zstd", "none"] = "gzip",
+) -> str:
+    """
+    Body of the ``pack`` command, callable without Click.
+
+    Packages *model_dir* and returns the summary the command prints.
+    """
+    from .core import ModelPackager
+    from .models import OCIConfig
+
     config = OCIConfig(
         model_name=name,
         version=model_version,
         framework=framework,
         architecture=architecture,
-        metadata=metadata,
+        metadata=metadata or {},
+    )
+    archive_path = ModelPackager(compressor=compressor).package(model_dir, config)
+    return "\n".join(
+        [
+            f"Packaged model: {archive_path}",
+            f"  Name        : {name}",
+            f"  Version     : {model_version}",
+            f"  Framework   : {framework}",
+            f"  Archive     : {archive_path}",
+        ]
     )
-    packager = ModelPackager()
-    try:
-        archive_path = packager.package(model_dir, config)
-    except (NotADirectoryError, FileNotFoundError) as exc:
-        click.echo(f"Error: {exc}", err=True)
-        sys.exit(1)
-
-    click.echo(f"Packaged model: {archive_path}")
-    click.echo(f"  Name        : {name}")
-    click.echo(f"  Version     : {model_version}")
-    click.echo(f"  Framework   : {framework}")
-    click.echo(f"  Archive     : {archive_path}")
 
 
 @main.command("unpack")
@@ -98,6 +139,8 @@ def pack_command(
 )
 def unpack_command(archive_path: str, output_dir: str) -> None:
     """Unpack an OCI model archive."""
+    from .core import ModelUnpackager
+
     unpacker = ModelUnpackager()
     try:
         config = unpacker.unpack(archive_path, output_dir)
@@ -118,60 +161,55 @@ def unpack_command(archive_path: str, output_dir: str) -> None:
     type=click.Path(exists=True, dir_okay=False),
     help="Path to the OCI tar archive.",
 )
-def inspect_command(archive_path: str) -> None:
+@click.option(
+    "--no-verify",
+    is_flag=True,
+    help="Only show config and layers; skip reading and hashing layer blobs.",
+)
+def inspect_command(archive_path: str, no_verify: bool) -> None:
     """Inspect an OCI model archive without extracting it."""
-    import tarfile
+    from .core import ModelUnpackager
 
     try:
-        with tarfile.open(archive_path, "r") as tar:
-            members = {m.name: m for m in tar.getmembers()}
-
-            # Read config
-            cfg_member = members.get("config.json")
-            if cfg_member:
-                fh = tar.extractfile(cfg_member)
-                if fh:
-                    config = OCIConfig.model_validate(json.loads(fh.read()))
-                    click.echo(f"Model    : {config.model_name}")
-                    click.echo(f"Version  : {config.version}")
-                    click.echo(f"Framework: {config.framework}")
-                    click.echo(f"Arch     : {config.architecture}")
-                    if config.metadata:
-                        click.echo(f"Metadata : {json.dumps(config.metadata)}")
-
-            # Read manifest
-            man_member = members.get("manifest.json")
-            if man_member:
-                fh = tar.extractfile(man_member)
-                if fh:
-                    from .models import OCIManifest
-                    manifest = OCIManifest.model_validate(json.loads(fh.read()))
-                    click.echo(f"\nLayers ({len(manifest.layers)}):")
-                    for layer in manifest.layers:
-                        title = layer.get("annotations", {}).get(
-                            "org.opencontainers.image.title", "(unknown)"
-                        )
-                        size_kb = layer.get("size", 0) / 1024
-                        click.echo(
-                            f"  {title:<40}  {size_kb:6.1f} KB  "
-                            f"{layer.get('digest', '')[:23]}..."
-                        )
-
-            # Verify layers
-            unpacker = ModelUnpackager()
-            verification = unpacker.verify_layers(archive_path)
-            click.echo(f"\nLayer verification ({len(verification)} layers):")
-            all_valid = True
-            for digest, valid in verification:
-                status = "OK" if valid else "FAIL"
-                if not valid:
-                    all_valid = False
-                click.echo(f"  {status}  {digest[:30]}...")
-            if all_valid:
-                click.echo("All layers verified.")
-            else:
-                click.echo("WARNING: some layers failed verification!", err=True)
-                sys.exit(1)
+        # A single sequential pass: config.json and manifest.json lead the
+        # archive, and blobs are hashed as they stream past for verification.
+        config, manifest, verification = ModelUnpackager().inspect(
+            archive_path, verify=not no_verify
+        )
+
+        if config is not None:
+            click.echo(f"Model    : {config.model_name}")
+            click.echo(f"Version  : {config.version}")
+            click.echo(f"Framework: {config.framework}")
+            click.echo(f"Arch     : {config.architecture}")
+            if config.metadata:
+                click.echo(f"Metadata : {json.dumps(config.metadata)}")
+
+        click.echo(f"\nLayers ({len(manifest.layers)}):")
+        for layer in manifest.layers:
+            title = layer.get("annotations", {}).get(
+                "org.opencontainers.image.title", "(unknown)"
+            )
+            size_kb = layer.get("size", 0) / 1024
+            click.echo(
+                f"  {title:<40}  {size_kb:6.1f} KB  {layer.get('digest', '')[:23]}..."
+            )
+
+        if verification is None:
+            return
+
+        click.echo(f"\nLayer verification ({len(verification)} layers):")
+        all_valid = True
+        for digest, valid in verification:
+            status = "OK" if valid else "FAIL"
+            if not valid:
+                all_valid = False
+            click.echo(f"  {status}  {digest[:30]}...")
+        if all_valid:
+            click.echo("All layers verified.")
+        else:
+            click.echo("WARNING: some layers failed verification!", err=True)
+            sys.exit(1)
 
     except Exception as exc:
         click.echo(f"Error inspecting archive: {exc}", err=True)
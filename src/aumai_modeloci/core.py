@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import contextlib
+import gzip
 import hashlib
 import io
-import json
 import os
 import tarfile
 import tempfile
+import time
+import zlib
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Literal, TypeVar, cast
+
+from pydantic import BaseModel
 
 from .models import ModelLayer, OCIConfig, OCIManifest
 
@@ -22,32 +30,285 @@ _MANIFEST_FILENAME = "manifest.json"
 _CONFIG_FILENAME = "config.json"
 _LAYERS_DIR = "blobs/sha256"
 
+# Bound once so hot loops skip the module attribute lookup.
+_HASH = hashlib.sha256
+_DIGEST_PREFIX = "sha256:"
+
+_MEDIA_TYPE_LAYER = "application/vnd.oci.image.layer.v1.tar"
+
+# Layer media type produced by each supported compressor.
+_LAYER_MEDIA_TYPES: dict[str, str] = {
+    "gzip": f"{_MEDIA_TYPE_LAYER}+gzip",
+    "zstd": f"{_MEDIA_TYPE_LAYER}+zstd",
+    "none": _MEDIA_TYPE_LAYER,
+}
+
+# Model weights barely compress, so favour speed over ratio.
+_GZIP_COMPRESSLEVEL = 1
+_ZSTD_LEVEL = 3
+
+# Weight formats that are already close to maximum entropy; compressing
+# them burns CPU for a negligible ratio, so they are stored as plain tar.
+_INCOMPRESSIBLE_EXT = frozenset(
+    {".safetensors", ".bin", ".onnx", ".pt", ".gguf", ".npz"}
+)
+# Large files of other types are probed with a fast compression of a
+# sample; if it saves less than _MIN_COMPRESSION_GAIN they go uncompressed.
+_PROBE_MIN_SIZE = 64 * 1024 * 1024
+_PROBE_SAMPLE_SIZE = 64 * 1024
+_MIN_COMPRESSION_GAIN = 0.05
+
+# Leading bytes identifying a compressed layer blob.
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Write buffer for the outer archive; large sequential writes keep the
+# syscall count low on multi-GB archives.
+_TAR_BUFSIZE = 1 << 20
+# Chunk size tarfile uses to copy member data in and out (its default is
+# 16 KiB, which means tens of thousands of reads per GB of weights).
+_COPY_BUFSIZE = 1 << 20
+
+# Average file size from which ``package`` builds layers on threads: zlib,
+# zstd and hashlib all release the GIL on large buffers, so big files
+# parallelize on threads, while small ones are dominated by Python-level
+# work that threads cannot overlap.
+_THREAD_MIN_AVG_SIZE = 1 << 20
+# Below this many blobs ``verify_layers`` hashes them in the calling
+# thread; a short list gains too little to cover starting the pool.
+_MIN_PARALLEL_BLOBS = 4
+
+_TarT = TypeVar("_TarT", bound=tarfile.TarFile)
+
+
+def _format_digest(hasher: hashlib._Hash) -> str:
+    """Return *hasher*'s result as an OCI 'sha256:<hex>' digest string."""
+    return _DIGEST_PREFIX + hasher.hexdigest()
+
+
+def _canonicalize(model: BaseModel) -> bytes:
+    """
+    Return the canonical serialized form of *model*.
+
+    Compact JSON in field order; any bytes that are hashed into a digest
+    must come from here so the digest is reproducible from the model.
+    """
+    return model.model_dump_json().encode("utf-8")
+
 
 def _sha256_file(path: str) -> str:
     """Return 'sha256:<hex>' digest for the file at *path*."""
-    h = hashlib.sha256()
-    with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(65536), b""):
-            h.update(chunk)
-    return f"sha256:{h.hexdigest()}"
+    # file_digest streams through one reused 256 KiB buffer via readinto, so
+    # memory stays constant however large the file (OpenSSL picks SHA-NI or
+    # ARMv8 crypto extensions where available); unbuffered avoids a copy.
+    # Larger buffers measured no faster: the chunk then falls out of L2.
+    with open(path, "rb", buffering=0) as fh:
+        return _format_digest(hashlib.file_digest(fh, _HASH))
 
 
 def _sha256_bytes(data: bytes) -> str:
     """Return 'sha256:<hex>' digest for *data*."""
-    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+    return _format_digest(_HASH(data))
+
+
+def _sha256_slice(path: str, offset: int, size: int) -> str:
+    """Return 'sha256:<hex>' digest of *size* bytes at *offset* in *path*."""
+    with open(path, "rb") as fh:
+        blob = _FileSlice(fh, offset, size)
+        return _format_digest(hashlib.file_digest(blob, _HASH))
+
+
+def _iter_files(root: str) -> list[tuple[str, str]]:
+    """
+    Return ``(full_path, rel_path)`` for every regular file under *root*.
+
+    Uses ``os.scandir`` so file types come from the directory listing
+    itself rather than an extra ``stat`` per entry.  Results are sorted by
+    relative path, component by component, matching ``sorted(rglob())``.
+    """
+    files: list[tuple[str, str]] = []
+    stack = [root]
+    prefix_len = len(os.path.join(root, ""))
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    files.append((entry.path, entry.path[prefix_len:]))
+    files.sort(key=lambda item: item[1].split(os.sep))
+    return files
+
+
+class _FileSlice:
+    """
+    Read-only view of *size* bytes of *fp* starting at *offset*.
+
+    Lets ``hashlib.file_digest`` hash a tar member in place, reading
+    straight into its own buffer instead of materializing the member.
+    """
+
+    def __init__(self, fp: io.BufferedIOBase, offset: int, size: int) -> None:
+        fp.seek(offset)
+        self.fp = fp
+        self.remaining = size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buf: memoryview | bytearray) -> int:
+        if self.remaining <= 0:
+            return 0
+        n = self.fp.readinto(memoryview(buf)[: self.remaining])
+        self.remaining -= n
+        return n
+
+
+class _HashingWriter:
+    """
+    Write-through wrapper that feeds every written byte into a SHA-256 hash.
+
+    Lets a blob be digested while it is being written, so the bytes never
+    have to be buffered in memory or read back from disk.
+    """
+
+    def __init__(self, fp: IO[bytes]) -> None:
+        self.fp = fp
+        self.hasher = _HASH()
+
+    def write(self, data: bytes) -> int:
+        self.hasher.update(data)
+        return self.fp.write(data)
+
+    def flush(self) -> None:
+        self.fp.flush()
+
+    def digest(self) -> str:
+        """Return the 'sha256:<hex>' digest of everything written so far."""
+        return _format_digest(self.hasher)
+
+
+class _CopyRangeTarFile(tarfile.TarFile):
+    """
+    ``TarFile`` that extracts regular members with ``os.copy_file_range``.
+
+    When the archive is an uncompressed file on disk, member data is copied
+    between file descriptors inside the kernel (as a reflink on filesystems
+    that support it) instead of through a user-space buffer.  Everything
+    else — compressed archives, sparse members, platforms or filesystems
+    without ``copy_file_range`` — uses the stock copy loop.
+    """
+
+    def makefile(
+        self,
+        tarinfo: tarfile.TarInfo,
+        targetpath: str | bytes | os.PathLike[str] | os.PathLike[bytes],
+    ) -> None:
+        source = self.fileobj
+        if (
+            not hasattr(os, "copy_file_range")
+            or not isinstance(source, io.BufferedReader)
+            or tarinfo.sparse is not None
+        ):
+            super().makefile(tarinfo, targetpath)
+            return
+        try:
+            with open(targetpath, "wb") as target:
+                offset, remaining = tarinfo.offset_data, tarinfo.size
+                while remaining:
+                    copied = os.copy_file_range(
+                        source.fileno(), target.fileno(), remaining, offset
+                    )
+                    if copied == 0:
+                        raise tarfile.ReadError("unexpected end of data")
+                    offset += copied
+                    remaining -= copied
+        except OSError:
+            # e.g. EXDEV across filesystems on older kernels; redo it the
+            # portable way (makefile reopens, and so truncates, the target).
+            super().makefile(tarinfo, targetpath)
+
+
+class _HashingTarFile(_CopyRangeTarFile):
+    """
+    ``TarFile`` that hashes layer blobs while extracting them.
+
+    The SHA-256 of every regular member under ``blobs/sha256/`` is recorded
+    in :attr:`blob_digests` by member name as its bytes are written out,
+    and the bytes of the root ``manifest.json`` are kept in
+    :attr:`manifest_data`, so callers never re-read them from disk.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        self.blob_digests: dict[str, str] = {}
+        self.manifest_data: bytes | None = None
+
+    def makefile(
+        self,
+        tarinfo: tarfile.TarInfo,
+        targetpath: str | bytes | os.PathLike[str] | os.PathLike[bytes],
+    ) -> None:
+        source = self.fileobj
+        if source is not None and tarinfo.name == _MANIFEST_FILENAME:
+            source.seek(tarinfo.offset_data)
+            data = source.read(tarinfo.size)
+            if len(data) != tarinfo.size:
+                raise tarfile.ReadError("unexpected end of data")
+            with open(targetpath, "wb") as target:
+                target.write(data)
+            self.manifest_data = data
+            return
+        if source is None or not tarinfo.name.startswith(f"{_LAYERS_DIR}/"):
+            super().makefile(tarinfo, targetpath)
+            return
+        source.seek(tarinfo.offset_data)
+        with open(targetpath, "wb") as target:
+            writer = _HashingWriter(target)
+            remaining = tarinfo.size
+            while remaining:
+                chunk = source.read(min(remaining, _COPY_BUFSIZE))
+                if not chunk:
+                    raise tarfile.ReadError("unexpected end of data")
+                writer.write(chunk)
+                remaining -= len(chunk)
+        self.blob_digests[tarinfo.name] = writer.digest()
 
 
 class ModelPackager:
     """
     Packages an ML model directory into an OCI-compliant tar archive.
 
-    Archive layout::
+    Archive layout, in member order::
 
-        blobs/sha256/<hex>      # layer tarballs
         config.json             # OCIConfig (JSON)
         manifest.json           # OCIManifest (JSON)
+        blobs/sha256/<hex>      # config blob (hard link to config.json)
+        blobs/sha256/<hex>      # layer tarballs
+
+    *compressor* selects how each layer blob is compressed: ``"gzip"``
+    (the default), ``"zstd"`` (requires the ``zstd`` extra) or ``"none"``
+    for a plain tar layer.  Files that would not benefit — known weight
+    formats such as ``.safetensors`` and large files that fail a quick
+    compressibility probe — are always stored as plain tar layers.
     """
 
+    def __init__(self, compressor: Literal["gzip", "zstd", "none"] = "gzip") -> None:
+        if compressor not in _LAYER_MEDIA_TYPES:
+            raise ValueError(
+                f"Unknown compressor {compressor!r}; "
+                f"expected one of {sorted(_LAYER_MEDIA_TYPES)}."
+            )
+        if compressor == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as exc:
+                raise ImportError(
+                    "zstd compression requires the 'zstandard' package; "
+                    "install it with: pip install 'aumai-modeloci[zstd]'"
+                ) from exc
+        self.compressor = compressor
+
     def package(self, model_dir: str, config: OCIConfig) -> str:
         """
         Create an OCI-compliant tar archive from *model_dir*.
@@ -62,46 +323,75 @@ class ModelPackager:
             model_path.parent / f"{config.model_name}-{config.version}.tar"
         )
 
-        layers: list[ModelLayer] = []
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp = Path(tmp_dir)
-            blobs_dir = tmp / _LAYERS_DIR
-            blobs_dir.mkdir(parents=True)
-
-            # Walk model_dir and create one layer per file
-            for file_path in sorted(model_path.rglob("*")):
-                if file_path.is_file():
-                    layer = self._create_layer_blob(
-                        str(file_path), str(blobs_dir), str(model_path)
-                    )
-                    layers.append(layer)
-
-            # Write config
-            config_bytes = config.model_dump_json(indent=2).encode("utf-8")
+        # Layer blobs are staged first so the manifest can lead the archive:
+        # streaming readers then find config.json and manifest.json in the
+        # first members.  The cost is disk space: every compressed blob sits
+        # in the staging directory before the output is opened.  Each one is
+        # deleted as soon as it is copied, so peak usage is the total size
+        # of the compressed layers plus the largest layer.
+        with tempfile.TemporaryDirectory() as blobs_dir:
+            layers = list(self._iter_layers(model_path, blobs_dir))
+
+            # Serialize config once; the same bytes back config.json, the
+            # config blob and its manifest descriptor.
+            config_bytes = _canonicalize(config)
             config_digest = _sha256_bytes(config_bytes)
-            config_blob_path = blobs_dir / config_digest.split(":")[1]
-            config_blob_path.write_bytes(config_bytes)
-
-            # Build manifest
-            manifest = self.create_manifest(config, layers)
+            manifest = self.create_manifest(
+                config,
+                layers,
+                config_bytes=config_bytes,
+                config_digest=config_digest,
+            )
             manifest_json = manifest.model_dump_json(indent=2)
-            (tmp / _MANIFEST_FILENAME).write_text(manifest_json, encoding="utf-8")
 
-            # Write human-readable config.json at root for convenience
-            (tmp / _CONFIG_FILENAME).write_bytes(config_bytes)
+            # Only an archive this call has started writing is removed on
+            # failure; an earlier one of the same name survives staging errors.
+            try:
+                with _large_copy_buffer(
+                    tarfile.open(output_archive, mode="w|", bufsize=_TAR_BUFSIZE)
+                ) as tar:
+                    _add_bytes(tar, _CONFIG_FILENAME, config_bytes)
+                    _add_bytes(tar, _MANIFEST_FILENAME, manifest_json.encode("utf-8"))
+                    # The config blob is a hard link to config.json, so its
+                    # bytes are stored only once (and extracted as an os.link
+                    # where the filesystem allows).
+                    _add_hardlink(
+                        tar,
+                        f"{_LAYERS_DIR}/{config_digest.split(':')[1]}",
+                        _CONFIG_FILENAME,
+                    )
 
-            # Bundle everything into the output tar
-            with tarfile.open(output_archive, "w") as tar:
-                tar.add(str(tmp), arcname="")
+                    for layer in layers:
+                        hex_digest = layer.digest.split(":")[1]
+                        blob_path = Path(blobs_dir) / hex_digest
+                        _add_blob(tar, str(blob_path), hex_digest)
+                        blob_path.unlink()
+            except BaseException:
+                Path(output_archive).unlink(missing_ok=True)
+                raise
 
         return output_archive
 
     def create_manifest(
-        self, config: OCIConfig, layers: list[ModelLayer]
+        self,
+        config: OCIConfig,
+        layers: list[ModelLayer],
+        *,
+        config_bytes: bytes | None = None,
+        config_digest: str | None = None,
     ) -> OCIManifest:
-        """Build an OCIManifest from config and layer list."""
-        config_bytes = config.model_dump_json(indent=2).encode("utf-8")
-        config_digest = _sha256_bytes(config_bytes)
+        """
+        Build an OCIManifest from config and layer list.
+
+        Callers that have already serialized *config* can pass the
+        resulting *config_bytes* (and their *config_digest*) to skip
+        serializing and hashing it again.
+        """
+        if config_bytes is None:
+            config_bytes = _canonicalize(config)
+            config_digest = None
+        if config_digest is None:
+            config_digest = _sha256_bytes(config_bytes)
 
         config_descriptor: dict[str, Any] = {
             "mediaType": "application/vnd.oci.image.config.v1+json",
@@ -117,14 +407,14 @@ class ModelPackager:
             }
             for layer in layers
         ]
-        return OCIManifest(
+        # Every field is built here from already-validated models, so skip
+        # a second validation pass.
+        return OCIManifest.model_construct(
             config=config_descriptor,
             layers=layer_descriptors,
         )
 
-    def add_layer(
-        self, archive_path: str, file_path: str
-    ) -> ModelLayer:
+    def add_layer(self, archive_path: str, file_path: str) -> ModelLayer:
         """
         Add a file as a new layer to an existing archive.
 
@@ -142,12 +432,9 @@ class ModelPackager:
             layer = self._create_layer_blob(file_path, str(blobs_dir), "")
 
             # Append blob to the archive
-            with tarfile.open(archive_path, "a") as tar:
+            with _large_copy_buffer(tarfile.open(archive_path, "a")) as tar:
                 blob_name = layer.digest.split(":")[1]
-                tar.add(
-                    str(blobs_dir / blob_name),
-                    arcname=f"{_LAYERS_DIR}/{blob_name}",
-                )
+                _add_blob(tar, str(blobs_dir / blob_name), blob_name)
 
         return layer
 
@@ -155,32 +442,231 @@ class ModelPackager:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _iter_layers(self, model_path: Path, blobs_dir: str) -> Iterator[ModelLayer]:
+        """
+        Create one layer blob per file under *model_path*, in path order.
+
+        Layers are independent, so when there are several CPUs and the files
+        are large on average they are built on a thread pool: per-layer time
+        is then spent in native compression and hashing that release the
+        GIL.  Otherwise they are built in the calling thread.  No worker
+        processes are started, so callers need no ``__main__`` guard under
+        the ``spawn`` or ``forkserver`` start methods.  Layers are yielded as
+        soon as they (and all earlier ones) are ready.
+        """
+        files = [full_path for full_path, _ in _iter_files(str(model_path))]
+        workers = min(len(files), os.cpu_count() or 1)
+        total_size = sum(os.path.getsize(f) for f in files)
+        if workers < 2 or total_size < _THREAD_MIN_AVG_SIZE * len(files):
+            for f in files:
+                yield self._create_layer_blob(f, blobs_dir, str(model_path))
+            return
+        # Threads start instantly, so even two large shards are worth it.
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            yield from ex.map(
+                self._create_layer_blob,
+                files,
+                repeat(blobs_dir),
+                repeat(str(model_path)),
+            )
+
     def _create_layer_blob(
         self, file_path: str, blobs_dir: str, base_dir: str
     ) -> ModelLayer:
         """
-        Create a gzip-compressed tar layer from a single file.
+        Create a compressed tar layer from a single file.
 
-        The layer blob is written to *blobs_dir* with its SHA-256 as filename.
+        The layer is streamed in one pass: the source is tarred into the
+        compressor, whose output is hashed as it is written to a temporary
+        file, which is then renamed to its SHA-256 inside *blobs_dir*.
         """
-        buf = io.BytesIO()
-        with tarfile.open(fileobj=buf, mode="w:gz") as layer_tar:
-            arcname = (
-                os.path.relpath(file_path, base_dir) if base_dir else Path(file_path).name
-            )
-            layer_tar.add(file_path, arcname=arcname)
-        blob_bytes = buf.getvalue()
-        digest = _sha256_bytes(blob_bytes)
-        hex_digest = digest.split(":")[1]
-        blob_path = Path(blobs_dir) / hex_digest
-        blob_path.write_bytes(blob_bytes)
-        rel_path = os.path.relpath(file_path, base_dir) if base_dir else Path(file_path).name
-        return ModelLayer(
+        rel_path = (
+            os.path.relpath(file_path, base_dir) if base_dir else Path(file_path).name
+        )
+        compressor = self._layer_compressor(file_path)
+        fd, tmp_blob = tempfile.mkstemp(dir=blobs_dir, suffix=".partial")
+        try:
+            with os.fdopen(fd, "wb") as blob_fh:
+                writer = _HashingWriter(blob_fh)
+                with self._open_compressor(writer, compressor) as stream:
+                    # dereference: a symlinked file (e.g. into a download
+                    # cache) is packed as its content, matching the size
+                    # and compressibility probe taken from its target.
+                    with _large_copy_buffer(
+                        tarfile.open(
+                            fileobj=stream,
+                            mode="w|",
+                            format=tarfile.PAX_FORMAT,
+                            dereference=True,
+                        )
+                    ) as layer_tar:
+                        layer_tar.add(file_path, arcname=rel_path)
+                blob_fh.flush()
+                size = os.fstat(blob_fh.fileno()).st_size
+            digest = writer.digest()
+            os.replace(tmp_blob, Path(blobs_dir) / digest.split(":")[1])
+        except BaseException:
+            Path(tmp_blob).unlink(missing_ok=True)
+            raise
+        # Built from values computed above; no validation needed.
+        return ModelLayer.model_construct(
             digest=digest,
-            size=len(blob_bytes),
+            size=size,
+            media_type=_LAYER_MEDIA_TYPES[compressor],
             annotations={"org.opencontainers.image.title": str(rel_path)},
         )
 
+    def _layer_compressor(self, file_path: str) -> str:
+        """Return the compressor to use for *file_path*'s layer."""
+        if self.compressor == "none":
+            return "none"
+        if Path(file_path).suffix.lower() in _INCOMPRESSIBLE_EXT:
+            return "none"
+        if os.path.getsize(file_path) > _PROBE_MIN_SIZE:
+            with open(file_path, "rb") as fh:
+                sample = fh.read(_PROBE_SAMPLE_SIZE)
+            if len(zlib.compress(sample, 1)) > len(sample) * (
+                1 - _MIN_COMPRESSION_GAIN
+            ):
+                return "none"
+        return self.compressor
+
+    def _open_compressor(
+        self, writer: _HashingWriter, compressor: str
+    ) -> contextlib.AbstractContextManager[Any]:
+        """Return a writable stream that *compressor* compresses into *writer*."""
+        if compressor == "gzip":
+            return gzip.GzipFile(
+                fileobj=writer,
+                mode="wb",
+                compresslevel=_GZIP_COMPRESSLEVEL,
+                mtime=0,
+            )
+        if compressor == "zstd":
+            import zstandard
+
+            cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+            zstd_writer: contextlib.AbstractContextManager[Any] = cctx.stream_writer(
+                writer, closefd=False
+            )
+            return zstd_writer
+        return contextlib.nullcontext(writer)
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    """Add an in-memory regular file called *name* to *tar*."""
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = 0o644
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _add_blob(tar: tarfile.TarFile, blob_path: str, hex_digest: str) -> None:
+    """Copy the staged blob at *blob_path* into *tar*."""
+    info = tar.gettarinfo(blob_path, arcname=f"{_LAYERS_DIR}/{hex_digest}")
+    info.mode = 0o644  # staged via mkstemp, which uses 0600
+    with open(blob_path, "rb") as blob_fh:
+        tar.addfile(info, blob_fh)
+
+
+def _add_hardlink(tar: tarfile.TarFile, name: str, target: str) -> None:
+    """Add *name* to *tar* as a hard link to the earlier member *target*."""
+    info = tarfile.TarInfo(name)
+    info.type = tarfile.LNKTYPE
+    info.linkname = target
+    info.mode = 0o644
+    info.mtime = int(time.time())
+    tar.addfile(info)
+
+
+def _large_copy_buffer(tar: _TarT) -> _TarT:
+    """Make *tar* copy member data in ``_COPY_BUFSIZE`` chunks; returns *tar*."""
+    # copybufsize is an undocumented TarFile constructor argument that the
+    # typed tarfile.open signature does not expose, so set it afterwards.
+    tar.copybufsize = _COPY_BUFSIZE  # type: ignore[attr-defined]
+    return tar
+
+
+def _scan_archive(tar: tarfile.TarFile) -> dict[str, tarfile.TarInfo]:
+    """
+    Walk *tar* once and return the members readers need, keyed by name.
+
+    Only the root ``manifest.json``/``config.json`` and the layer blobs are
+    kept, and the returned ``TarInfo`` objects carry their data offsets, so
+    later ``extractfile`` calls seek straight to them instead of scanning.
+    ``tar.members`` is cleared as the walk goes, so other members are not
+    held in memory; *tar* cannot resolve names or links afterwards.
+    """
+    blob_prefix = f"{_LAYERS_DIR}/"
+    found: dict[str, tarfile.TarInfo] = {}
+    while (member := tar.next()) is not None:
+        # TarFile.next() records every header it reads; drop them.
+        tar.members.clear()  # type: ignore[attr-defined]
+        name = member.name
+        if name in (_MANIFEST_FILENAME, _CONFIG_FILENAME) or name.startswith(
+            blob_prefix
+        ):
+            found[name] = member
+    return found
+
+
+def _read_manifest(
+    tar: tarfile.TarFile, members: dict[str, tarfile.TarInfo]
+) -> OCIManifest:
+    """Parse ``manifest.json`` from *tar* using its scanned *members*."""
+    manifest_member = members.get(_MANIFEST_FILENAME)
+    if manifest_member is None:
+        raise FileNotFoundError(f"manifest.json not found in {tar.name!r}.")
+    manifest_fh = tar.extractfile(manifest_member)
+    if manifest_fh is None:
+        raise RuntimeError("Could not read manifest.json from archive.")
+    return OCIManifest.model_validate_json(manifest_fh.read())
+
+
+def _read_stream(
+    tar: tarfile.TarFile, blob_digests: dict[str, str] | None = None
+) -> tuple[OCIConfig | None, OCIManifest | None]:
+    """
+    Read ``config.json`` and ``manifest.json`` from a streaming *tar*.
+
+    Archives written by ``ModelPackager`` store both as their first two
+    members, so reading stops there.  When *blob_digests* is given the
+    rest of the archive is read too, and the digest of every layer blob is
+    recorded in it by member name, letting callers verify in the same pass.
+    """
+    config: OCIConfig | None = None
+    manifest: OCIManifest | None = None
+    blob_prefix = f"{_LAYERS_DIR}/"
+    for member in tar:
+        fh = tar.extractfile(member) if member.isreg() else None
+        if fh is None:
+            continue
+        if member.name == _CONFIG_FILENAME:
+            config = OCIConfig.model_validate_json(fh.read())
+        elif member.name == _MANIFEST_FILENAME:
+            manifest = OCIManifest.model_validate_json(fh.read())
+        elif blob_digests is not None and member.name.startswith(blob_prefix):
+            # extractfile returns a BufferedReader, which file_digest can
+            # read into directly.
+            blob = cast(io.BufferedReader, fh)
+            blob_digests[member.name] = _format_digest(hashlib.file_digest(blob, _HASH))
+        if blob_digests is None and config is not None and manifest is not None:
+            break
+    return config, manifest
+
+
+def _match_blob_digests(
+    manifest: OCIManifest, blob_digests: dict[str, str]
+) -> list[tuple[str, bool]]:
+    """Pair each manifest layer digest with whether its blob hashed to it."""
+    results: list[tuple[str, bool]] = []
+    for layer_desc in manifest.layers:
+        digest: str = layer_desc["digest"]
+        blob_name = f"{_LAYERS_DIR}/{digest.split(':')[1]}"
+        results.append((digest, blob_digests.get(blob_name) == digest))
+    return results
+
 
 class ModelUnpackager:
     """
@@ -192,75 +678,218 @@ class ModelUnpackager:
         Extract *archive_path* into *output_dir*.
 
         Reads ``config.json`` from the archive root and returns the
-        parsed ``OCIConfig``.
+        parsed ``OCIConfig``.  Layer blobs are extracted as-is under
+        ``blobs/sha256/``; use :meth:`extract_layer` to unpack the model
+        files they contain.
         """
-        output = Path(output_dir)
-        output.mkdir(parents=True, exist_ok=True)
+        with _large_copy_buffer(_CopyRangeTarFile.open(archive_path, "r")) as tar:
+            self._extract_all(tar, output_dir)
+        return self._read_config(archive_path, output_dir)
 
-        with tarfile.open(archive_path, "r") as tar:
-            try:
-                tar.extractall(path=str(output), filter="data")
-            except TypeError:
-                # Python <3.12 does not support the filter argument.
-                # Manually validate each member to prevent path traversal.
-                resolved_output = output.resolve()
-                for member in tar.getmembers():
-                    member_path = (resolved_output / member.name).resolve()
-                    if not str(member_path).startswith(str(resolved_output)):
-                        raise ValueError(
-                            f"Attempted path traversal in archive member: {member.name!r}"
-                        )
-                tar.extractall(path=str(output))  # noqa: S202
+    def unpack_and_verify(
+        self, archive_path: str, output_dir: str
+    ) -> tuple[OCIConfig, list[tuple[str, bool]]]:
+        """
+        Extract *archive_path* like :meth:`unpack` and verify its layers.
 
-        config_file = output / _CONFIG_FILENAME
-        if not config_file.exists():
-            raise FileNotFoundError(
-                f"config.json not found in archive {archive_path!r}."
-            )
-        return OCIConfig.model_validate(
-            json.loads(config_file.read_text())
-        )
+        Each layer blob is hashed while it is copied out, so the archive is
+        read once instead of once for ``unpack`` and again for
+        :meth:`verify_layers`.  Returns the parsed ``OCIConfig`` and the
+        (digest, is_valid) list that ``verify_layers`` would return in
+        ``"full"`` mode.
+        """
+        with _large_copy_buffer(_HashingTarFile.open(archive_path, "r")) as tar:
+            self._extract_all(tar, output_dir)
+            blob_digests, manifest_data = tar.blob_digests, tar.manifest_data
+        config = self._read_config(archive_path, output_dir)
+
+        # Verify against the manifest read in this pass, not whatever
+        # manifest.json happens to be in output_dir.
+        if manifest_data is None:
+            raise FileNotFoundError(f"manifest.json not found in {archive_path!r}.")
+        manifest = OCIManifest.model_validate_json(manifest_data)
+        return config, _match_blob_digests(manifest, blob_digests)
+
+    def extract_layer(self, blob_path: str, dest_dir: str) -> list[str]:
+        """
+        Extract the files contained in the layer blob at *blob_path*.
+
+        The blob's compression is detected from its leading bytes.  gzip
+        layers are inflated with ``rapidgzip`` across all cores when it is
+        installed (the ``rapidgzip`` extra), falling back to single-threaded
+        ``gzip``; zstd layers require the ``zstd`` extra.
+
+        Returns the names of the extracted members.
+        """
+        with self._open_layer(blob_path) as stream:
+            with _large_copy_buffer(
+                tarfile.open(fileobj=stream, mode="r|")
+            ) as layer_tar:
+                return self._extract_all(layer_tar, dest_dir)
 
     def verify_layers(
-        self, archive_path: str
+        self, archive_path: str, mode: Literal["quick", "full"] = "full"
     ) -> list[tuple[str, bool]]:
         """
         Verify the SHA-256 digest of every layer blob in the archive.
 
-        Returns a list of (digest, is_valid) tuples.  A layer is valid
-        when its stored filename matches the SHA-256 of its content.
+        Returns a list of (digest, is_valid) tuples.  In ``"full"`` mode a
+        layer is valid when its stored content hashes to its digest; the
+        blob is hashed straight from its offset in the archive file, with
+        larger archives spread across a thread pool.  Blob offsets come from
+        a single walk over the tar headers, and only ``manifest.json`` is
+        parsed, so a damaged ``config.json`` does not affect the result.
+        ``"quick"`` mode only checks that each blob is present with the
+        size recorded in the manifest, without reading any blob data.
         """
-        results: list[tuple[str, bool]] = []
+        if mode not in ("quick", "full"):
+            raise ValueError(
+                f"Unknown verify mode {mode!r}; expected 'quick' or 'full'."
+            )
 
         with tarfile.open(archive_path, "r") as tar:
-            members = {m.name: m for m in tar.getmembers()}
+            members = _scan_archive(tar)
+            manifest = _read_manifest(tar, members)
+        blobs: list[tuple[int, int] | None] = []
+        for layer_desc in manifest.layers:
+            hex_digest = layer_desc["digest"].split(":")[1]
+            member = members.get(f"{_LAYERS_DIR}/{hex_digest}")
+            if member is None or not member.isreg():
+                blobs.append(None)
+            else:
+                blobs.append((member.offset_data, member.size))
+        return self._verify_blobs(archive_path, manifest, blobs, mode)
+
+    def inspect(
+        self, archive_path: str, *, verify: bool = True
+    ) -> tuple[OCIConfig | None, OCIManifest, list[tuple[str, bool]] | None]:
+        """
+        Read *archive_path*'s config and manifest without extracting it.
+
+        The archive is read in a single sequential pass: ``config.json``
+        and ``manifest.json`` lead archives written by ``ModelPackager``,
+        so reading stops after them unless *verify* is set, in which case
+        every layer blob is hashed as it streams past.  Returns the config
+        (``None`` if the archive has none), the manifest, and the
+        (digest, is_valid) list ``verify_layers`` would return in
+        ``"full"`` mode, or ``None`` when *verify* is false.
+        """
+        blob_digests: dict[str, str] | None = {} if verify else None
+        with tarfile.open(archive_path, "r|") as tar:
+            config, manifest = _read_stream(tar, blob_digests)
+        if manifest is None:
+            raise FileNotFoundError(f"manifest.json not found in {archive_path!r}.")
+        if blob_digests is None:
+            return config, manifest, None
+        return config, manifest, _match_blob_digests(manifest, blob_digests)
 
-            # Read manifest to know which digests to expect
-            manifest_member = members.get(_MANIFEST_FILENAME)
-            if manifest_member is None:
-                raise FileNotFoundError(
-                    f"manifest.json not found in {archive_path!r}."
-                )
-            manifest_fh = tar.extractfile(manifest_member)
-            if manifest_fh is None:
-                raise RuntimeError("Could not read manifest.json from archive.")
-            manifest = OCIManifest.model_validate(
-                json.loads(manifest_fh.read().decode("utf-8"))
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _extract_all(self, tar: tarfile.TarFile, output_dir: str) -> list[str]:
+        """
+        Safely extract all of *tar* into *output_dir*; return member names.
+
+        Works on streaming (``"r|"``) archives as well as seekable ones.
+        """
+        output = Path(output_dir)
+        output.mkdir(parents=True, exist_ok=True)
+
+        try:
+            tar.extractall(path=str(output), filter="data")
+        except TypeError as exc:
+            # Python <3.12 does not support the filter argument.
+            # Validate each member as it is read to prevent path traversal;
+            # a single pass keeps this usable on streams.
+            resolved_output = output.resolve()
+            for member in tar:
+                member_path = (resolved_output / member.name).resolve()
+                if not str(member_path).startswith(str(resolved_output)):
+                    raise ValueError(
+                        f"Attempted path traversal in archive member: {member.name!r}"
+                    ) from exc
+                tar.extract(member, path=str(output))  # noqa: S202
+        return [member.name for member in tar.getmembers()]
+
+    def _read_config(self, archive_path: str, output_dir: str) -> OCIConfig:
+        """Parse the ``config.json`` extracted from *archive_path*."""
+        config_file = Path(output_dir) / _CONFIG_FILENAME
+        if not config_file.exists():
+            raise FileNotFoundError(
+                f"config.json not found in archive {archive_path!r}."
             )
+        return OCIConfig.model_validate_json(config_file.read_bytes())
 
-            for layer_desc in manifest.layers:
-                digest: str = layer_desc["digest"]
-                hex_digest = digest.split(":")[1]
-                blob_name = f"{_LAYERS_DIR}/{hex_digest}"
-                blob_member = members.get(blob_name)
-                if blob_member is None:
-                    results.append((digest, False))
-                    continue
-                blob_fh = tar.extractfile(blob_member)
-                if blob_fh is None:
-                    results.append((digest, False))
-                    continue
-                actual_digest = _sha256_bytes(blob_fh.read())
-                results.append((digest, actual_digest == digest))
+    def _open_layer(self, blob_path: str) -> contextlib.AbstractContextManager[Any]:
+        """Return a readable, decompressed stream over a layer blob."""
+        with open(blob_path, "rb") as fh:
+            magic = fh.read(len(_ZSTD_MAGIC))
 
+        if magic.startswith(_GZIP_MAGIC):
+            try:
+                import rapidgzip
+            except ImportError:
+                return gzip.open(blob_path, "rb")
+            gz_stream: contextlib.AbstractContextManager[Any] = rapidgzip.open(
+                blob_path, parallelization=os.cpu_count() or 1
+            )
+            return gz_stream
+        if magic == _ZSTD_MAGIC:
+            try:
+                import zstandard
+            except ImportError as exc:
+                raise ImportError(
+                    "zstd layers require the 'zstandard' package; "
+                    "install it with: pip install 'aumai-modeloci[zstd]'"
+                ) from exc
+            zstd_stream: contextlib.AbstractContextManager[Any] = (
+                zstandard.ZstdDecompressor().stream_reader(open(blob_path, "rb"))
+            )
+            return zstd_stream
+        return open(blob_path, "rb")
+
+    def _verify_blobs(
+        self,
+        archive_path: str,
+        manifest: OCIManifest,
+        blobs: list[tuple[int, int] | None],
+        mode: Literal["quick", "full"] = "full",
+    ) -> list[tuple[str, bool]]:
+        """
+        Verify *manifest*'s layers against their blob locations.
+
+        *blobs* holds one ``(offset_data, size)`` pair per manifest layer,
+        or ``None`` for a layer whose blob is missing from the archive.
+        """
+        digests: list[str] = [layer_desc["digest"] for layer_desc in manifest.layers]
+        if mode == "quick":
+            return [
+                (digest, blob is not None and blob[1] == layer_desc["size"])
+                for digest, blob, layer_desc in zip(
+                    digests, blobs, manifest.layers, strict=True
+                )
+            ]
+
+        # Each blob is hashed from its own file handle at a known offset, so
+        # layers verify independently; hashing releases the GIL, letting
+        # threads run them in parallel.
+        present = [blob for blob in blobs if blob is not None]
+        offsets = [offset for offset, _ in present]
+        sizes = [size for _, size in present]
+        if len(present) < _MIN_PARALLEL_BLOBS:
+            hashed = list(map(_sha256_slice, repeat(archive_path), offsets, sizes))
+        else:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+                hashed = list(
+                    ex.map(_sha256_slice, repeat(archive_path), offsets, sizes)
+                )
+
+        results: list[tuple[str, bool]] = []
+        actual = iter(hashed)
+        for digest, blob in zip(digests, blobs, strict=True):
+            if blob is None:
+                results.append((digest, False))
+            else:
+                results.append((digest, next(actual) == digest))
         return results
@@ -16,8 +16,8 @@ __all__ = [
 class ModelLayer(BaseModel):
     """A single layer in an OCI image, representing a file blob."""
 
-    digest: str            # sha256:<hex>
-    size: int              # bytes
+    digest: str  # sha256:<hex>
+    size: int  # bytes
     media_type: str = "application/vnd.oci.image.layer.v1.tar+gzip"
     annotations: dict[str, str] = Field(default_factory=dict)
 
@@ -27,8 +27,8 @@ class OCIConfig(BaseModel):
 
     model_name: str
     version: str
-    framework: str         # e.g. "pytorch", "tensorflow", "onnx", "safetensors"
-    architecture: str      # e.g. "transformer", "cnn", "custom"
+    framework: str  # e.g. "pytorch", "tensorflow", "onnx", "safetensors"
+    architecture: str  # e.g. "transformer", "cnn", "custom"
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
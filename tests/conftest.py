@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import shutil
+import tarfile
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 from aumai_modeloci.core import ModelPackager, ModelUnpackager
-from aumai_modeloci.models import OCIConfig
+from aumai_modeloci.models import OCIConfig, OCIManifest
+
+
+def _read_archive_manifest(archive: str | Path) -> OCIManifest:
+    """Return the manifest stored in the tar archive at *archive*."""
+    with tarfile.open(archive, "r") as tar:
+        fh = tar.extractfile("manifest.json")
+        assert fh is not None
+        return OCIManifest.model_validate_json(fh.read())
 
 
 # ---------------------------------------------------------------------------
@@ -15,8 +26,7 @@ from aumai_modeloci.models import OCIConfig
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def sample_config() -> OCIConfig:
+def _make_sample_config() -> OCIConfig:
     return OCIConfig(
         model_name="test-model",
         version="1.0.0",
@@ -26,6 +36,11 @@ def sample_config() -> OCIConfig:
     )
 
 
+@pytest.fixture()
+def sample_config() -> OCIConfig:
+    return _make_sample_config()
+
+
 @pytest.fixture()
 def minimal_config() -> OCIConfig:
     return OCIConfig(
@@ -41,10 +56,8 @@ def minimal_config() -> OCIConfig:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def model_dir(tmp_path: Path) -> Path:
-    """A temp directory with a few fake model files."""
-    d = tmp_path / "model"
+def _make_model_dir(parent: Path) -> Path:
+    d = parent / "model"
     d.mkdir()
     (d / "weights.bin").write_bytes(b"\x00\x01\x02\x03" * 256)
     (d / "config.json").write_text('{"hidden_size": 768}', encoding="utf-8")
@@ -54,6 +67,22 @@ def model_dir(tmp_path: Path) -> Path:
     return d
 
 
+@pytest.fixture()
+def model_dir(tmp_path: Path) -> Path:
+    """A temp directory with a few fake model files."""
+    return _make_model_dir(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def shared_model_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only model directory shared by the whole session.
+
+    Packing writes its archive next to the model directory, so tests that
+    call ``package`` themselves use the function-scoped ``model_dir``.
+    """
+    return _make_model_dir(tmp_path_factory.mktemp("shared_pkg"))
+
+
 @pytest.fixture()
 def single_file(tmp_path: Path) -> Path:
     """A single fake model file."""
@@ -82,11 +111,32 @@ def unpacker() -> ModelUnpackager:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def packed_archive(shared_model_dir: Path) -> str:
+    """Return the path to a packed OCI archive of ``shared_model_dir``.
+
+    Packed once per session; tests must not modify it — use
+    ``mutable_packed_archive`` instead.
+    """
+    return ModelPackager().package(str(shared_model_dir), _make_sample_config())
+
+
+@pytest.fixture(scope="session")
+def packed_tar(packed_archive: str) -> Iterator[tarfile.TarFile]:
+    """``packed_archive`` opened once for reading, shared by the session."""
+    with tarfile.open(packed_archive, "r") as tar:
+        yield tar
+
+
+@pytest.fixture(scope="session")
+def packed_archive_members(packed_tar: tarfile.TarFile) -> dict[str, tarfile.TarInfo]:
+    """Members of ``packed_tar`` by name, collected in a single pass."""
+    return {member.name: member for member in packed_tar}
+
+
 @pytest.fixture()
-def packed_archive(
-    packager: ModelPackager,
-    model_dir: Path,
-    sample_config: OCIConfig,
-) -> str:
-    """Return the path to a packed OCI archive."""
-    return packager.package(str(model_dir), sample_config)
+def mutable_packed_archive(packed_archive: str, tmp_path: Path) -> str:
+    """Return a private copy of ``packed_archive`` that a test may modify."""
+    copy = tmp_path / Path(packed_archive).name
+    shutil.copyfile(packed_archive, copy)
+    return str(copy)
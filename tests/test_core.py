@@ -3,13 +3,27 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
+import os
+import sys
 import tarfile
 from pathlib import Path
+from typing import Any
 
 import pytest
-
-from aumai_modeloci.core import ModelPackager, ModelUnpackager, _sha256_bytes, _sha256_file
+from conftest import _read_archive_manifest
+
+from aumai_modeloci import core
+from aumai_modeloci.core import (
+    ModelPackager,
+    ModelUnpackager,
+    _iter_files,
+    _scan_archive,
+    _sha256_bytes,
+    _sha256_file,
+    _sha256_slice,
+)
 from aumai_modeloci.models import ModelLayer, OCIConfig, OCIManifest
 
 
@@ -34,6 +48,15 @@ class TestSha256Helpers:
         f.write_bytes(data)
         assert _sha256_file(str(f)) == _sha256_bytes(data)
 
+    def test_sha256_slice_matches_bytes(self, tmp_path: Path) -> None:
+        data = os.urandom(100_000)
+        f = tmp_path / "archive.bin"
+        f.write_bytes(data)
+        # Unaligned, empty and past-the-end slices.
+        for offset, size in [(512, 70_000), (0, 0), (90_000, 50_000)]:
+            expected = _sha256_bytes(data[offset : offset + size])
+            assert _sha256_slice(str(f), offset, size) == expected
+
     def test_sha256_file_format(self, tmp_path: Path) -> None:
         f = tmp_path / "f.bin"
         f.write_bytes(b"data")
@@ -100,56 +123,332 @@ class TestModelPackager:
 
     def test_archive_contains_manifest_json(
         self,
-        packed_archive: str,
+        packed_archive_members: dict[str, tarfile.TarInfo],
     ) -> None:
-        with tarfile.open(packed_archive, "r") as tar:
-            names = [m.name for m in tar.getmembers()]
-        assert "manifest.json" in names
+        assert "manifest.json" in packed_archive_members
 
     def test_archive_contains_config_json(
         self,
-        packed_archive: str,
+        packed_archive_members: dict[str, tarfile.TarInfo],
     ) -> None:
-        with tarfile.open(packed_archive, "r") as tar:
-            names = [m.name for m in tar.getmembers()]
-        assert "config.json" in names
+        assert "config.json" in packed_archive_members
 
     def test_archive_contains_blobs_directory(
         self,
-        packed_archive: str,
+        packed_archive_members: dict[str, tarfile.TarInfo],
     ) -> None:
-        with tarfile.open(packed_archive, "r") as tar:
-            names = [m.name for m in tar.getmembers()]
-        blob_entries = [n for n in names if "blobs/sha256" in n]
+        blob_entries = [n for n in packed_archive_members if "blobs/sha256" in n]
         assert len(blob_entries) > 0
 
     def test_config_json_in_archive_matches_input(
         self,
-        packed_archive: str,
+        packed_tar: tarfile.TarFile,
+        packed_archive_members: dict[str, tarfile.TarInfo],
         sample_config: OCIConfig,
     ) -> None:
-        with tarfile.open(packed_archive, "r") as tar:
-            members = {m.name: m for m in tar.getmembers()}
-            fh = tar.extractfile(members["config.json"])
-            assert fh is not None
-            cfg = OCIConfig.model_validate(json.loads(fh.read()))
+        fh = packed_tar.extractfile(packed_archive_members["config.json"])
+        assert fh is not None
+        cfg = OCIConfig.model_validate(json.loads(fh.read()))
         assert cfg.model_name == sample_config.model_name
         assert cfg.version == sample_config.version
         assert cfg.framework == sample_config.framework
 
-    def test_manifest_has_layers_for_each_file(
+    def test_manifest_config_descriptor_matches_config_blob(
+        self,
+        packed_archive: str,
+    ) -> None:
+        manifest = _read_archive_manifest(packed_archive)
+        with tarfile.open(packed_archive, "r") as tar:
+            digest = manifest.config["digest"]
+            blob_fh = tar.extractfile(f"blobs/sha256/{digest.split(':')[1]}")
+            config_fh = tar.extractfile("config.json")
+            assert blob_fh is not None and config_fh is not None
+            blob = blob_fh.read()
+            assert _sha256_bytes(blob) == digest
+            assert len(blob) == manifest.config["size"]
+            assert config_fh.read() == blob
+
+    def test_config_blob_is_hardlink_to_config_json(
+        self,
+        packed_archive: str,
+    ) -> None:
+        manifest = _read_archive_manifest(packed_archive)
+        with tarfile.open(packed_archive, "r") as tar:
+            digest = manifest.config["digest"]
+            blob_member = tar.getmember(f"blobs/sha256/{digest.split(':')[1]}")
+        assert blob_member.islnk()
+        assert blob_member.linkname == "config.json"
+
+    def test_metadata_members_come_first(
         self,
         packed_archive: str,
-        model_dir: Path,
     ) -> None:
-        file_count = sum(1 for f in model_dir.rglob("*") if f.is_file())
+        with tarfile.open(packed_archive, "r|") as tar:
+            first, second = tar.next(), tar.next()
+        assert first is not None and second is not None
+        assert [first.name, second.name] == ["config.json", "manifest.json"]
+
+    def test_scan_archive_does_not_keep_members(self, packed_archive: str) -> None:
         with tarfile.open(packed_archive, "r") as tar:
-            members = {m.name: m for m in tar.getmembers()}
-            fh = tar.extractfile(members["manifest.json"])
+            found = _scan_archive(tar)
+            assert tar.members == []
+            fh = tar.extractfile(found["manifest.json"])
             assert fh is not None
-            manifest = OCIManifest.model_validate(json.loads(fh.read()))
+            manifest = OCIManifest.model_validate_json(fh.read())
+        for layer in manifest.layers:
+            assert f"blobs/sha256/{layer['digest'].split(':')[1]}" in found
+
+    def test_verify_after_add_layer(
+        self,
+        packager: ModelPackager,
+        mutable_packed_archive: str,
+        tmp_path: Path,
+    ) -> None:
+        extra = tmp_path / "extra.txt"
+        extra.write_text("appended")
+        packager.add_layer(mutable_packed_archive, str(extra))
+        results = ModelUnpackager().verify_layers(mutable_packed_archive)
+        assert all(valid for _, valid in results)
+
+    def test_manifest_has_layers_for_each_file(
+        self,
+        packed_archive: str,
+        shared_model_dir: Path,
+    ) -> None:
+        file_count = sum(1 for p in shared_model_dir.rglob("*") if p.is_file())
+        manifest = _read_archive_manifest(packed_archive)
         assert len(manifest.layers) == file_count
 
+    def test_package_many_files_keeps_sorted_layer_order(
+        self, packager: ModelPackager, tmp_path: Path, sample_config: OCIConfig
+    ) -> None:
+        shards = tmp_path / "sharded"
+        shards.mkdir()
+        names = [f"model-{i:05d}-of-00006.bin" for i in range(6)]
+        for i, name in enumerate(names):
+            (shards / name).write_bytes(bytes([i]) * 1024)
+        archive = packager.package(str(shards), sample_config)
+        manifest = _read_archive_manifest(archive)
+        titles = [
+            layer["annotations"]["org.opencontainers.image.title"]
+            for layer in manifest.layers
+        ]
+        assert titles == names
+        assert all(valid for _, valid in ModelUnpackager().verify_layers(archive))
+
+    def test_package_large_files_on_threads_keeps_layer_order(
+        self,
+        packager: ModelPackager,
+        tmp_path: Path,
+        sample_config: OCIConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        pools: list[core.ThreadPoolExecutor] = []
+
+        class RecordingPool(core.ThreadPoolExecutor):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        monkeypatch.setattr(core, "_THREAD_MIN_AVG_SIZE", 1)
+        monkeypatch.setattr(core, "ThreadPoolExecutor", RecordingPool)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        shards = tmp_path / "sharded"
+        shards.mkdir()
+        names = [f"shard-{i}.bin" for i in range(3)]
+        for i, name in enumerate(names):
+            (shards / name).write_bytes(os.urandom(1024) * (i + 1))
+        archive = packager.package(str(shards), sample_config)
+        manifest = _read_archive_manifest(archive)
+        titles = [
+            layer["annotations"]["org.opencontainers.image.title"]
+            for layer in manifest.layers
+        ]
+        assert titles == names
+        assert len(pools) == 1
+        assert all(valid for _, valid in ModelUnpackager().verify_layers(archive))
+
+    @pytest.mark.parametrize(
+        ("cpus", "file_size"), [(1, 2 << 20), (4, 1024)], ids=["one-cpu", "small-files"]
+    )
+    def test_package_builds_layers_inline(
+        self,
+        packager: ModelPackager,
+        tmp_path: Path,
+        sample_config: OCIConfig,
+        monkeypatch: pytest.MonkeyPatch,
+        cpus: int,
+        file_size: int,
+    ) -> None:
+        def no_pool(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("a worker pool was started")
+
+        monkeypatch.setattr(core, "ThreadPoolExecutor", no_pool)
+        monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+        model = tmp_path / "model"
+        model.mkdir()
+        for i in range(4):
+            (model / f"part-{i}.bin").write_bytes(bytes([i]) * file_size)
+        archive = packager.package(str(model), sample_config)
+        monkeypatch.undo()
+        results = ModelUnpackager().verify_layers(archive)
+        assert len(results) == 4
+        assert all(valid for _, valid in results)
+
+    def test_pack_uses_large_bufsize(
+        self,
+        packager: ModelPackager,
+        model_dir: Path,
+        sample_config: OCIConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        opened: dict[str, int] = {}
+        real_open = tarfile.open
+
+        def recording_open(*args: Any, **kwargs: Any) -> tarfile.TarFile:
+            name = kwargs.get("name", args[0] if args else None)
+            opened[str(name)] = kwargs.get("bufsize", tarfile.RECORDSIZE)
+            return real_open(*args, **kwargs)
+
+        monkeypatch.setattr(tarfile, "open", recording_open)
+        archive = packager.package(str(model_dir), sample_config)
+        assert opened[archive] >= 512 * 1024
+
+    def test_package_uncompressed_layers(
+        self, tmp_path: Path, model_dir: Path, sample_config: OCIConfig
+    ) -> None:
+        archive = ModelPackager(compressor="none").package(
+            str(model_dir), sample_config
+        )
+        manifest = _read_archive_manifest(archive)
+        assert {layer["mediaType"] for layer in manifest.layers} == {
+            "application/vnd.oci.image.layer.v1.tar"
+        }
+        assert all(valid for _, valid in ModelUnpackager().verify_layers(archive))
+
+    def test_package_zstd_round_trip(
+        self, tmp_path: Path, model_dir: Path, sample_config: OCIConfig
+    ) -> None:
+        pytest.importorskip("zstandard")
+        archive = ModelPackager(compressor="zstd").package(
+            str(model_dir), sample_config
+        )
+        unpacker = ModelUnpackager()
+        assert all(valid for _, valid in unpacker.verify_layers(archive))
+
+        out = tmp_path / "unpacked"
+        unpacker.unpack(archive, str(out))
+        manifest = OCIManifest.model_validate_json(
+            (out / "manifest.json").read_text(encoding="utf-8")
+        )
+        zstd_layers = [
+            layer
+            for layer in manifest.layers
+            if layer["mediaType"] == "application/vnd.oci.image.layer.v1.tar+zstd"
+        ]
+        assert zstd_layers
+        for layer in zstd_layers:
+            title = layer["annotations"]["org.opencontainers.image.title"]
+            blob = out / "blobs" / "sha256" / layer["digest"].split(":")[1]
+            names = unpacker.extract_layer(str(blob), str(tmp_path / "layers"))
+            assert names == [title]
+            assert (tmp_path / "layers" / title).read_bytes() == (
+                model_dir / title
+            ).read_bytes()
+
+    def test_zstd_without_extra_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+        with pytest.raises(ImportError, match="aumai-modeloci\\[zstd\\]"):
+            ModelPackager(compressor="zstd")
+
+    def test_layer_compression_depends_on_file(
+        self, packager: ModelPackager, tmp_path: Path, sample_config: OCIConfig
+    ) -> None:
+        d = tmp_path / "mixed"
+        d.mkdir()
+        (d / "model.safetensors").write_bytes(b"\x00" * 32 * 1024)
+        (d / "config.json").write_text('{"hidden_size": 768}', encoding="utf-8")
+        (d / "merges.txt").write_text("a b\n" * 16 * 1024, encoding="utf-8")
+        archive = packager.package(str(d), sample_config)
+        manifest = _read_archive_manifest(archive)
+        media_types = {
+            layer["annotations"]["org.opencontainers.image.title"]: layer["mediaType"]
+            for layer in manifest.layers
+        }
+        assert media_types == {
+            "config.json": "application/vnd.oci.image.layer.v1.tar+gzip",
+            "merges.txt": "application/vnd.oci.image.layer.v1.tar+gzip",
+            "model.safetensors": "application/vnd.oci.image.layer.v1.tar",
+        }
+
+    def test_symlinked_file_is_packed_as_its_content(
+        self,
+        packager: ModelPackager,
+        unpacker: ModelUnpackager,
+        tmp_path: Path,
+        sample_config: OCIConfig,
+    ) -> None:
+        cache = tmp_path / "cache"
+        cache.mkdir()
+        (cache / "blob").write_bytes(b"weights" * 100)
+        d = tmp_path / "linked"
+        d.mkdir()
+        (d / "model.bin").symlink_to(cache / "blob")
+        archive = packager.package(str(d), sample_config)
+
+        out = tmp_path / "out"
+        _, results = unpacker.unpack_and_verify(archive, str(out))
+        assert all(valid for _, valid in results)
+        [(digest, _)] = results
+        restored = tmp_path / "restored"
+        blob = out / "blobs" / "sha256" / digest.split(":")[1]
+        assert unpacker.extract_layer(str(blob), str(restored)) == ["model.bin"]
+        assert not (restored / "model.bin").is_symlink()
+        assert (restored / "model.bin").read_bytes() == b"weights" * 100
+
+    def test_large_file_compression_is_probed(
+        self,
+        packager: ModelPackager,
+        tmp_path: Path,
+        sample_config: OCIConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(core, "_PROBE_MIN_SIZE", 16 * 1024)
+        d = tmp_path / "probed"
+        d.mkdir()
+        (d / "random.dat").write_bytes(os.urandom(64 * 1024))
+        (d / "zeros.dat").write_bytes(bytes(64 * 1024))
+        archive = packager.package(str(d), sample_config)
+        manifest = _read_archive_manifest(archive)
+        media_types = {
+            layer["annotations"]["org.opencontainers.image.title"]: layer["mediaType"]
+            for layer in manifest.layers
+        }
+        assert media_types == {
+            "random.dat": "application/vnd.oci.image.layer.v1.tar",
+            "zeros.dat": "application/vnd.oci.image.layer.v1.tar+gzip",
+        }
+
+    def test_small_file_layer_is_compressed(
+        self, packager: ModelPackager, tmp_path: Path, sample_config: OCIConfig
+    ) -> None:
+        d = tmp_path / "small"
+        d.mkdir()
+        (d / "config.json").write_text('{"hidden_size": 768}', encoding="utf-8")
+        (d / "special_tokens.txt").write_text("<s>\n</s>\n" * 30, encoding="utf-8")
+        archive = packager.package(str(d), sample_config)
+        manifest = _read_archive_manifest(archive)
+        # A plain tar layer is padded to a full 10 KiB record; small files
+        # must compress to a fraction of that.
+        assert len(manifest.layers) == 2
+        for layer in manifest.layers:
+            assert layer["mediaType"] == "application/vnd.oci.image.layer.v1.tar+gzip"
+            assert layer["size"] < tarfile.RECORDSIZE // 10
+
+    def test_unknown_compressor_raises(self) -> None:
+        with pytest.raises(ValueError, match="compressor"):
+            ModelPackager(compressor="lz4")  # type: ignore[arg-type]
+
     def test_package_raises_for_non_directory(
         self, packager: ModelPackager, tmp_path: Path, sample_config: OCIConfig
     ) -> None:
@@ -166,6 +465,26 @@ class TestModelPackager:
         archive = packager.package(str(empty_dir), sample_config)
         assert Path(archive).exists()
 
+    def test_failed_staging_keeps_existing_archive(
+        self,
+        packager: ModelPackager,
+        model_dir: Path,
+        sample_config: OCIConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        existing = (
+            model_dir.parent / f"{sample_config.model_name}-{sample_config.version}.tar"
+        )
+        existing.write_bytes(b"previous archive")
+
+        def fail(*args: Any) -> ModelLayer:
+            raise RuntimeError("staging failed")
+
+        monkeypatch.setattr(packager, "_create_layer_blob", fail)
+        with pytest.raises(RuntimeError, match="staging failed"):
+            packager.package(str(model_dir), sample_config)
+        assert existing.read_bytes() == b"previous archive"
+
     def test_create_manifest_has_correct_media_type(
         self,
         packager: ModelPackager,
@@ -200,40 +519,56 @@ class TestModelPackager:
     def test_add_layer_returns_model_layer(
         self,
         packager: ModelPackager,
-        packed_archive: str,
+        mutable_packed_archive: str,
         tmp_path: Path,
     ) -> None:
         extra_file = tmp_path / "extra.bin"
         extra_file.write_bytes(b"extra content" * 10)
-        layer = packager.add_layer(packed_archive, str(extra_file))
+        layer = packager.add_layer(mutable_packed_archive, str(extra_file))
         assert isinstance(layer, ModelLayer)
         assert layer.digest.startswith("sha256:")
         assert layer.size > 0
 
+    def test_add_layer_appends_readable_blob(
+        self,
+        packager: ModelPackager,
+        mutable_packed_archive: str,
+        tmp_path: Path,
+    ) -> None:
+        extra_file = tmp_path / "extra.bin"
+        extra_file.write_bytes(b"extra content" * 10)
+        layer = packager.add_layer(mutable_packed_archive, str(extra_file))
+        with tarfile.open(mutable_packed_archive, "r") as tar:
+            member = tar.getmembers()[-1]
+            fh = tar.extractfile(member)
+            assert fh is not None
+            assert _sha256_bytes(fh.read()) == layer.digest
+        assert member.name == f"blobs/sha256/{layer.digest.split(':')[1]}"
+        assert member.mode == 0o644
+
     def test_add_layer_missing_file_raises(
         self,
         packager: ModelPackager,
-        packed_archive: str,
+        mutable_packed_archive: str,
     ) -> None:
         with pytest.raises(FileNotFoundError):
-            packager.add_layer(packed_archive, "/nonexistent/file.bin")
+            packager.add_layer(mutable_packed_archive, "/nonexistent/file.bin")
 
     def test_layer_blob_digest_matches_content(
         self,
-        packager: ModelPackager,
-        packed_archive: str,
+        packed_tar: tarfile.TarFile,
+        packed_archive_members: dict[str, tarfile.TarInfo],
     ) -> None:
         """Every blob in the archive must have a name matching its sha256."""
-        with tarfile.open(packed_archive, "r") as tar:
-            for member in tar.getmembers():
-                if "blobs/sha256/" in member.name:
-                    hex_digest = member.name.split("/")[-1]
-                    fh = tar.extractfile(member)
-                    if fh:
-                        actual = hashlib.sha256(fh.read()).hexdigest()
-                        assert actual == hex_digest, (
-                            f"Blob {hex_digest!r} digest mismatch"
-                        )
+        for name, member in packed_archive_members.items():
+            if "blobs/sha256/" in name:
+                hex_digest = name.split("/")[-1]
+                fh = packed_tar.extractfile(member)
+                if fh:
+                    actual = hashlib.file_digest(fh, "sha256").hexdigest()
+                    assert actual == hex_digest, (
+                        f"Blob {hex_digest!r} digest mismatch"
+                    )
 
 
 # ---------------------------------------------------------------------------
@@ -288,6 +623,50 @@ class TestModelUnpackager:
         with pytest.raises(FileNotFoundError, match="config.json"):
             unpacker.unpack(bad_archive, str(tmp_path / "out"))
 
+    def test_extract_layer_restores_model_files(
+        self,
+        unpacker: ModelUnpackager,
+        packed_archive: str,
+        shared_model_dir: Path,
+        tmp_path: Path,
+    ) -> None:
+        out_dir = tmp_path / "unpacked"
+        unpacker.unpack(packed_archive, str(out_dir))
+        manifest = OCIManifest.model_validate(
+            json.loads((out_dir / "manifest.json").read_text())
+        )
+        restored = tmp_path / "restored"
+        for layer in manifest.layers:
+            blob = out_dir / "blobs" / "sha256" / layer["digest"].split(":")[1]
+            names = unpacker.extract_layer(str(blob), str(restored))
+            assert names == [layer["annotations"]["org.opencontainers.image.title"]]
+        for original, rel in _iter_files(str(shared_model_dir)):
+            assert (restored / rel).read_bytes() == Path(original).read_bytes()
+
+    def test_extract_layer_rejects_traversal_without_filter_support(
+        self,
+        unpacker: ModelUnpackager,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        real_extractall = tarfile.TarFile.extractall
+
+        def old_extractall(self: tarfile.TarFile, *args: Any, **kwargs: Any) -> None:
+            # Mimic a Python without extraction filters.
+            if "filter" in kwargs:
+                raise TypeError("unexpected keyword argument 'filter'")
+            real_extractall(self, *args, **kwargs)
+
+        monkeypatch.setattr(tarfile.TarFile, "extractall", old_extractall)
+        blob = tmp_path / "evil.tar"
+        with tarfile.open(blob, "w") as tar:
+            info = tarfile.TarInfo("../escaped.txt")
+            info.size = 1
+            tar.addfile(info, io.BytesIO(b"x"))
+        with pytest.raises(ValueError, match="path traversal"):
+            unpacker.extract_layer(str(blob), str(tmp_path / "dest"))
+        assert not (tmp_path / "escaped.txt").exists()
+
     def test_verify_layers_returns_list(
         self,
         unpacker: ModelUnpackager,
@@ -306,6 +685,69 @@ class TestModelUnpackager:
         for digest, valid in results:
             assert valid, f"Layer {digest} failed verification"
 
+    def test_verify_layers_quick_mode(
+        self,
+        unpacker: ModelUnpackager,
+        packed_archive: str,
+    ) -> None:
+        results = unpacker.verify_layers(packed_archive, mode="quick")
+        assert results == unpacker.verify_layers(packed_archive)
+
+    def test_verify_layers_detects_corrupted_blob(
+        self,
+        unpacker: ModelUnpackager,
+        packed_archive: str,
+        tmp_path: Path,
+    ) -> None:
+        corrupted = tmp_path / "corrupted.tar"
+        data = bytearray(Path(packed_archive).read_bytes())
+        manifest = _read_archive_manifest(packed_archive)
+        with tarfile.open(packed_archive, "r") as tar:
+            bad_digest = manifest.layers[0]["digest"]
+            member = tar.getmember(f"blobs/sha256/{bad_digest.split(':')[1]}")
+            data[member.offset_data] ^= 0xFF
+        corrupted.write_bytes(bytes(data))
+
+        full = dict(unpacker.verify_layers(str(corrupted)))
+        assert full[bad_digest] is False
+        assert sum(not valid for valid in full.values()) == 1
+        # Quick mode does not read blob content, so it cannot see the flip.
+        assert all(valid for _, valid in unpacker.verify_layers(str(corrupted), "quick"))
+
+    def test_inspect_matches_verify_layers(
+        self,
+        unpacker: ModelUnpackager,
+        packed_archive: str,
+        sample_config: OCIConfig,
+    ) -> None:
+        config, manifest, results = unpacker.inspect(packed_archive)
+        assert config == sample_config
+        assert len(manifest.layers) == 3
+        assert results == unpacker.verify_layers(packed_archive)
+
+        _, _, skipped = unpacker.inspect(packed_archive, verify=False)
+        assert skipped is None
+
+    def test_verify_layers_ignores_invalid_config(
+        self,
+        unpacker: ModelUnpackager,
+        packed_archive: str,
+        tmp_path: Path,
+    ) -> None:
+        # Same archive, but config.json no longer parses as an OCIConfig.
+        broken = str(tmp_path / "broken_config.tar")
+        with tarfile.open(packed_archive, "r") as src, tarfile.open(broken, "w") as dst:
+            for member in src.getmembers():
+                fh = src.extractfile(member) if member.isreg() else None
+                data = fh.read() if fh is not None else None
+                if member.name == "config.json":
+                    data = b"not an OCIConfig"
+                    member.size = len(data)
+                dst.addfile(member, io.BytesIO(data) if data is not None else None)
+        results = unpacker.verify_layers(broken)
+        assert results == unpacker.verify_layers(packed_archive)
+        assert all(valid for _, valid in results)
+
     def test_verify_layers_missing_manifest_raises(
         self,
         unpacker: ModelUnpackager,
@@ -328,9 +770,51 @@ class TestModelUnpackager:
         sample_config: OCIConfig,
     ) -> None:
         out_dir = tmp_path / "unpacked"
-        config = unpacker.unpack(packed_archive, str(out_dir))
+        config, results = unpacker.unpack_and_verify(packed_archive, str(out_dir))
         assert config.model_name == sample_config.model_name
+        assert (out_dir / "manifest.json").exists()
         # Verify the unpacked archive was also valid
-        results = unpacker.verify_layers(packed_archive)
+        assert results == unpacker.verify_layers(packed_archive)
         for _, valid in results:
             assert valid
+
+    def test_unpack_and_verify_ignores_stale_manifest(
+        self,
+        unpacker: ModelUnpackager,
+        packed_archive: str,
+        tmp_path: Path,
+        sample_config: OCIConfig,
+    ) -> None:
+        out_dir = tmp_path / "out"
+        unpacker.unpack(packed_archive, str(out_dir))
+        # An archive without a manifest, unpacked over the earlier output.
+        no_manifest = str(tmp_path / "no_manifest.tar")
+        with tarfile.open(no_manifest, "w") as tar:
+            data = sample_config.model_dump_json().encode("utf-8")
+            info = tarfile.TarInfo("config.json")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        with pytest.raises(FileNotFoundError, match="manifest.json"):
+            unpacker.unpack_and_verify(no_manifest, str(out_dir))
+
+    def test_unpack_and_verify_detects_corrupted_blob(
+        self,
+        unpacker: ModelUnpackager,
+        mutable_packed_archive: str,
+        tmp_path: Path,
+    ) -> None:
+        manifest = _read_archive_manifest(mutable_packed_archive)
+        with tarfile.open(mutable_packed_archive, "r") as tar:
+            bad_digest = manifest.layers[-1]["digest"]
+            member = tar.getmember(f"blobs/sha256/{bad_digest.split(':')[1]}")
+        with open(mutable_packed_archive, "r+b") as archive_fh:
+            archive_fh.seek(member.offset_data)
+            first = archive_fh.read(1)
+            archive_fh.seek(member.offset_data)
+            archive_fh.write(bytes([first[0] ^ 0xFF]))
+
+        _, results = unpacker.unpack_and_verify(
+            mutable_packed_archive, str(tmp_path / "out")
+        )
+        assert dict(results)[bad_digest] is False
+        assert sum(not valid for _, valid in results) == 1